@@ -2,6 +2,7 @@
 Biosignal processing functions. Some of the methods in this file are concepts still under development.
 """
 
+import functools
 import numpy as np
 from scipy import signal
 
@@ -21,6 +22,7 @@ _biosignal = {
         'notch': None,
         'N_pass': 6,
         'N_stop': 9, # Use a higher N for bandstop filters.
+        'zero_phase': True,
     },
     'input': None,
     'montage': None,
@@ -41,6 +43,8 @@ Global variables used in these methods.
     - `notch`: Critical frequency of the notch filter, or None if not set.
     - `N_pass`: Default Butterworth filter N value for bandpass type filters.
     - `N_stop`: Default Butterworth filter N value for bandstop type filters.
+    - `zero_phase`: Filter forward and backward for zero phase distortion (default). If False, a single forward pass is
+      used instead, which takes roughly half the time but shifts the phase of the filtered signal.
 - `input`: List of per-channel float32 numpy arrays mirroring the SAB content for each channel, or None if `biosignal_set_buffers` has not been called.
    Each entry is allocated lazily on first access by `_ensure_input_array(idx)`; only the channel-and-range slices that a compute step actually touches are copied from the live SAB into this array (see `_refresh_channel_range`).
    Unrefreshed positions hold zeros — every read path must refresh its required range first.
@@ -48,6 +52,64 @@ Global variables used in these methods.
 - `output`: List of output signals where processing results should be written, or None if not set.
 """
 
+@functools.lru_cache(maxsize=128)
+def _get_sos (N, Wn, btype, fs):
+    """
+    Get Butterworth SOS filter coefficients.\\
+    The same filter parameters recur for every channel and every calculated signal part, so the results are cached
+    and the filter is only designed once per parameter set. The sampling rate is part of the cache key, so the cache
+    never returns a design for another recording. It is only cleared to release unused designs, in
+    `biosignal_set_buffers`, `biosignal_set_default_filters` and `biosignal_set_filter`.
+
+    Parameters
+    ----------
+    N : int
+        Order of the filter.
+    Wn : float / tuple
+        Critical frequency or frequencies of the filter.
+    btype : str
+        Scipy filter type (`highpass`, `lowpass` or `bandstop`).
+    fs : float
+        Sampling frequency of the source signal.
+
+    Returns
+    -------
+    SOS filter coefficients. The array is shared between callers and must not be modified.
+    """
+    return signal.butter(N, Wn, btype, output='sos', fs=fs)
+
+@functools.lru_cache(maxsize=32)
+def _get_filter_cascade (fs, highpass, lowpass, notch):
+    """
+    Get the cascaded SOS filter coefficients of the given filters together with their steady-state filter state.\\
+    Cached for the same reasons as `_get_sos` and cleared at the same time.
+
+    Parameters
+    ----------
+    fs : float
+        Sampling frequency of the source signal.
+    highpass : float
+        Critical frequency of the highpass filter, or None.
+    lowpass : float
+        Critical frequency of the lowpass filter, or None.
+    notch : float
+        Critical frequency of the notch filter, or None.
+
+    Returns
+    -------
+    Tuple of SOS filter coefficients for all the filter sections and their steady-state initial conditions (see
+    `scipy.signal.sosfilt_zi`). The arrays are shared between callers and must not be modified.
+    """
+    sos_sections = []
+    if highpass:
+        sos_sections.append(biosignal_get_filter_coefficients('highpass', highpass, fs))
+    if lowpass:
+        sos_sections.append(biosignal_get_filter_coefficients('lowpass', lowpass, fs))
+    if notch:
+        sos_sections.append(biosignal_get_filter_coefficients('notch', notch, fs))
+    sos = np.concatenate(sos_sections)
+    return sos, signal.sosfilt_zi(sos)
+
 def _ensure_input_array (channel_idx):
     """Lazily allocate the full-channel-sized numpy backing for a single channel.
 
@@ -76,7 +138,7 @@ def _refresh_channel_range (channel_idx, start, end):
     header_len = _biosignal['data_pos']
     # Header (sampling_rate, updated_start, updated_end) — small, always refreshed.
     buf.subarray(0, header_len).assign_to(target[0:header_len])
-    # Data range — clamp to SAB bounds; callers handle out-of-bounds via np.pad.
+    # Data range — clamp to SAB bounds; callers handle out-of-bounds via `_biosignal_pad`.
     buf_len = len(buf)
     s = max(int(start), header_len)
     e = min(int(end), buf_len)
@@ -110,6 +172,38 @@ def biosignal_add_montage ():
     _biosignal['available_montages'][name] = montage
     return { 'success': True }
 
+def _biosignal_apply_filter (sos, sig, padtype='odd', zi=None):
+    """
+    Apply the filter `sos` to `sig` along its last axis.
+
+    Filters forward and backward unless `zero_phase` has been disabled in the default filters, in which case a single
+    forward pass is made, with the filter state starting from the steady state of the first sample.
+
+    Parameters
+    ----------
+    sos : ndarray
+        SOS filter coefficients.
+    sig : ndarray
+        The signal or a 2-dimensional array of signals to filter.
+    padtype : str
+        Type of edge extension to use in forward + backward filtering (see `scipy.signal.sosfiltfilt`).
+    zi : ndarray
+        Steady-state filter state from `scipy.signal.sosfilt_zi` for the single forward pass (optional, is computed
+        if not given).
+
+    Returns
+    -------
+    The filtered signal(s).
+    """
+    sig = np.asarray(sig)
+    if _biosignal['filters']['zero_phase']:
+        return signal.sosfiltfilt(sos, sig, axis=-1, padtype=padtype)
+    if zi is None:
+        zi = signal.sosfilt_zi(sos)
+    # Scale the steady state of each signal by its first sample, broadcast to (n_sections, ..., 2).
+    zi = zi.reshape((zi.shape[0],) + (1,)*(sig.ndim - 1) + (2,))*sig[..., 0][np.newaxis, ..., np.newaxis]
+    return signal.sosfilt(sos, sig, axis=-1, zi=zi)[0]
+
 def _biosignal_insert_gaps (sig, gaps):
     """
     Insert zero-filled interruptions into `sig` at the positions given in `gaps`.
@@ -129,21 +223,57 @@ def _biosignal_insert_gaps (sig, gaps):
     -------
     The signal with zeroes inserted, longer than the input by the total interruption length.
     """
-    offset = 0
+    total_len = sum(max(gap[1] - gap[0], 0) for gap in gaps)
+    if not total_len:
+        return sig
+    # Allocate the final signal once and copy each run of signal data between the interruptions to its place, instead
+    # of concatenating a new copy of the whole signal for every interruption.
+    gapped = np.empty(len(sig) + total_len, dtype='f')
+    src_pos = 0
+    dst_pos = 0
     for gap in gaps:
         length = gap[1] - gap[0]
         if length <= 0:
             continue
-        start = gap[0] + offset
-        sig = np.concatenate((sig[:start], np.zeros(length, dtype='f'), sig[start:]))
-        offset += length
-    return sig
+        run_end = min(max(gap[0], src_pos), len(sig))
+        run_len = run_end - src_pos
+        gapped[dst_pos:dst_pos + run_len] = sig[src_pos:run_end]
+        dst_pos += run_len
+        gapped[dst_pos:dst_pos + length] = 0
+        dst_pos += length
+        src_pos = run_end
+    gapped[dst_pos:] = sig[src_pos:]
+    return gapped
+
+def _biosignal_pad (sig, pad_start, pad_end):
+    """
+    Copy `sig` into a new zero-filled float32 array, leaving `pad_start` zeroes before and `pad_end` zeroes after it.
+
+    Same result as `np.pad(sig, (pad_start, pad_end), 'constant')` without the overhead of the generic padding routine,
+    which is noticeable when it is called for every channel of a short signal part.
+
+    Parameters
+    ----------
+    sig : 1darray
+        The signal to pad.
+    pad_start : int
+        Number of zeroes to add to the start of the signal.
+    pad_end : int
+        Number of zeroes to add to the end of the signal.
+
+    Returns
+    -------
+    The padded signal.
+    """
+    padded = np.zeros(pad_start + len(sig) + pad_end, dtype='f')
+    padded[pad_start:pad_start + len(sig)] = sig
+    return padded
 
 def _biosignal_remove_gaps (sig, gaps):
     """
     Remove the zeroes `_biosignal_insert_gaps` inserted, restoring the gap-free signal.
 
-    Walks the interruptions in reverse and unwinds the same offsets, so the spans removed are the
+    Walks the interruptions in order and accumulates the same offsets, so the spans removed are the
     ones that were inserted rather than whatever content has since shifted into their raw positions.
 
     Parameters
@@ -157,15 +287,27 @@ def _biosignal_remove_gaps (sig, gaps):
     -------
     The signal without the inserted zeroes.
     """
-    offset = sum(max(gap[1] - gap[0], 0) for gap in gaps)
-    for gap in reversed(gaps):
+    if not any(gap[1] > gap[0] for gap in gaps):
+        return sig
+    # Copy the runs of signal data between the interruptions into one output array, instead of deleting each
+    # interruption from a new copy of the whole signal.
+    kept = np.empty(len(sig), dtype=sig.dtype)
+    offset = 0
+    src_pos = 0
+    dst_pos = 0
+    for gap in gaps:
         length = gap[1] - gap[0]
         if length <= 0:
             continue
-        offset -= length
-        start = gap[0] + offset
-        sig = np.delete(sig, np.s_[start:start + length])
-    return sig
+        start = min(max(gap[0] + offset, src_pos), len(sig))
+        run_len = start - src_pos
+        kept[dst_pos:dst_pos + run_len] = sig[src_pos:start]
+        dst_pos += run_len
+        src_pos = min(start + length, len(sig))
+        offset += length
+    run_len = len(sig) - src_pos
+    kept[dst_pos:dst_pos + run_len] = sig[src_pos:]
+    return kept[:dst_pos + run_len]
 
 def biosignal_calculate_signals ():
     """
@@ -206,9 +348,8 @@ def biosignal_calculate_signals ():
             'error': "Cannot calculate signals, input has not been set."
         }
     # We need to extract the channel properties from these Proxies before they are automatically destroyed.
-    py_channels = [None]*len(channels)
-    for idx, channel in enumerate(channels):
-        py_channels[idx] = channel.to_py()
+    # Convert the whole list at once, crossing the JS-Python boundary once instead of once per channel.
+    py_channels = channels.to_py()
     signals = biosignal_get_signals(py_channels)
     for idx, sig in enumerate(signals):
         if sig is None:
@@ -234,8 +375,8 @@ def biosignal_calculate_signals ():
             if len(sig) > out_len:
                 sig = sig[:out_len]
             else:
-                sig = np.pad(sig, (0, out_len - len(sig)), 'constant')
-        # Filtering breaks contiguity, so make sure the result can be assigned.
+                sig = _biosignal_pad(sig, 0, out_len - len(sig))
+        # Derived signals are already contiguous float32, so this only copies if they are not.
         output[idx].assign(np.ascontiguousarray(sig, dtype='f'))
     return {
         'success': True
@@ -244,7 +385,9 @@ def biosignal_calculate_signals ():
 def biosignal_filter_signal (sig, fs, filters = None):
     """
     Filter the given signal.\\
-    Uses a Butterworth filter and forward + backward filtering passes under the hood.
+    Uses Butterworth filters and forward + backward filtering passes under the hood, or a single forward pass if
+    `zero_phase` has been disabled in the default filters. The sections of all the requested filters are cascaded, so
+    the signal is only traversed once in each direction.
 
     Parameters
     ----------
@@ -264,35 +407,43 @@ def biosignal_filter_signal (sig, fs, filters = None):
     if filters is None:
         filters = _biosignal['filters']
     try:
-        if filters is not None:
-            # Apply each filter individually.
-            if filters['highpass'] is not None:
-                sos_hp = biosignal_get_filter_coefficients(
-                    'highpass',
-                    filters['highpass']['Wn'],
-                    fs,
-                    filters['highpass']['N']
-                )
-                sig = signal.sosfiltfilt(sos_hp, sig)
-            if filters['lowpass'] is not None:
-                sos_lp = biosignal_get_filter_coefficients(
-                    'lowpass',
-                    filters['highpass']['Wn'],
-                    fs,
-                    filters['highpass']['N']
-                )
-                sig = signal.sosfiltfilt(sos_lp, sig)
-            if filters['notch'] is not None:
-                sos_notch = biosignal_get_filter_coefficients(
-                    'notch',
-                    filters['highpass']['Wn'],
-                    fs,
-                    filters['highpass']['N']
-                )
-                sig = signal.sosfiltfilt(sos_notch, sig)
+        if filters['highpass'] is None and filters['lowpass'] is None and filters['notch'] is None:
+            # Nothing to filter, return the signal as is.
+            return {
+                'success': True,
+                'value': np.asarray(sig, dtype='f'),
+            }
+        # Cascade the sections of each filter and apply them all in a single pass in each direction.
+        sos_sections = []
+        if filters['highpass'] is not None:
+            sos_hp = biosignal_get_filter_coefficients(
+                'highpass',
+                filters['highpass']['Wn'],
+                fs,
+                filters['highpass']['N']
+            )
+            sos_sections.append(sos_hp)
+        if filters['lowpass'] is not None:
+            sos_lp = biosignal_get_filter_coefficients(
+                'lowpass',
+                filters['lowpass']['Wn'],
+                fs,
+                filters['lowpass']['N']
+            )
+            sos_sections.append(sos_lp)
+        if filters['notch'] is not None:
+            sos_notch = biosignal_get_filter_coefficients(
+                'notch',
+                filters['notch']['Wn'],
+                fs,
+                filters['notch']['N']
+            )
+            sos_sections.append(sos_notch)
+        sig = _biosignal_apply_filter(np.concatenate(sos_sections), sig)
         return {
             'success': True,
-            'value': np.array(sig, dtype='f'),
+            # Only converts (and copies) if the signal is not float32 already.
+            'value': np.asarray(sig, dtype='f'),
         }
     except Exception as e:
         return {
@@ -321,12 +472,14 @@ def biosignal_get_filter_coefficients (btype, Wn, fs, N=None):
     """
     N_pass = _biosignal['filters']['N_pass']
     N_stop = _biosignal['filters']['N_stop']
+    # Round the critical frequency so that values differing only by floating point error share a cache entry.
+    Wn = round(Wn, 6)
     if btype == 'highpass':
-        return signal.butter(N or N_pass, Wn, 'highpass', output='sos', fs=fs)
+        return _get_sos(N or N_pass, Wn, 'highpass', fs)
     if btype == 'lowpass':
-        return signal.butter(N or N_pass, Wn, 'lowpass', output='sos', fs=fs)
+        return _get_sos(N or N_pass, Wn, 'lowpass', fs)
     if btype == 'notch':
-        return signal.butter(N or N_stop, [(Wn - 1), (Wn + 1)], 'bandstop', output='sos', fs=fs)
+        return _get_sos(N or N_stop, (round(Wn - 1, 6), round(Wn + 1, 6)), 'bandstop', fs)
     return None
 
 def biosignal_get_signals (channels):
@@ -344,6 +497,8 @@ def biosignal_get_signals (channels):
         - `end` (int): Ending index (excluded) of the signal data in the input buffer, including filter padding.
             In case of index exceeding signal length, that amount of zeroes is added to the end of the signal as padding.
         - `filter_len` (int): Length of the filter part at the start and end of the signal array, in data points.
+            When this padding is present it serves as the filter warm-up, and the forward-backward filter does not
+            add its own edge extension on top of it.
         - `filters` (dict): Channel filter critical frequencies as:\\
                             -- highpass (float or None to use default for signal type)\\
                             -- lowpass (float or None to use default for signal type)\\
@@ -360,12 +515,18 @@ def biosignal_get_signals (channels):
     if _biosignal['buffers'] is None or _biosignal['input'] is None:
         return [None]*len(channels)
     input_sigs = _biosignal['input']
+    buffers = _biosignal['buffers']
+    # These do not change during the call, so resolve them only once instead of for every channel.
+    data_pos = _biosignal['data_pos']
+    empty_field = _biosignal['empty_field']
+    sampling_rate_idx = _biosignal['data_fields']['sampling_rate']
+    updated_start_idx = _biosignal['data_fields']['updated_start']
+    updated_end_idx = _biosignal['data_fields']['updated_end']
     # Cache common ref values (speeds up average reference calculations).
     common_ref = {}
-    # Cache filter coefficients by sampling rate and filter frequency.
-    hp_coeffs = {}
-    lp_coeffs = {}
-    notch_coeffs = {}
+    # Indices of derived signals grouped by sampling rate, filters and signal length. Each group is filtered with a
+    # single call once all the channels have been derived.
+    filter_groups = {}
     signals = [None]*len(channels)
     # Per-call dedup of slice refreshes: when many montage channels share an active or
     # reference at the same range (e.g. average reference), copy that slice only once.
@@ -380,10 +541,15 @@ def biosignal_get_signals (channels):
         if 'active' not in chan:
             # Empty channel.
             continue
+        # Read the channel properties used throughout the derivation only once.
+        active = chan['active']
+        refs = chan['reference']
+        gaps = chan['data_gaps']
+        is_common_ref = chan['common_ref']
         # Determine the SAB range needed for this derivation (active and references share it).
         # Use the buffer length directly so we don't depend on `act` being allocated yet.
-        buf_len = len(_biosignal['buffers'][chan['active']])
-        act_len = buf_len - _biosignal['data_pos']
+        buf_len = len(buffers[active])
+        act_len = buf_len - data_pos
         # Store possibly needed pad amounts for range that exceeds imput signal range.
         pad_start = 0
         if chan['start'] < 0:
@@ -391,104 +557,95 @@ def biosignal_get_signals (channels):
         pad_end = 0
         if chan['end'] > act_len:
             pad_end = chan['end'] - act_len
-        start_pos = _biosignal['data_pos'] + chan['start'] + pad_start
-        end_pos = _biosignal['data_pos'] + chan['end'] - pad_end
+        start_pos = data_pos + chan['start'] + pad_start
+        end_pos = data_pos + chan['end'] - pad_end
         # Slice-refresh active and reference channels before any read. The header
         # (sampling_rate / updated_start / updated_end) is always refreshed inside
         # `_refresh_channel_range`, so the load-status check below sees live values.
-        _refresh(chan['active'], start_pos, end_pos)
-        for ref_idx in chan['reference']:
+        _refresh(active, start_pos, end_pos)
+        for ref_idx in refs:
             _refresh(ref_idx, start_pos, end_pos)
-        act = input_sigs[chan['active']]
-        sig_fs = act[_biosignal['data_fields']['sampling_rate']]
-        updated_start = act[_biosignal['data_fields']['updated_start']]
-        if updated_start > start_pos or updated_start == _biosignal['empty_field']:
+        act = input_sigs[active]
+        sig_fs = act[sampling_rate_idx]
+        updated_start = act[updated_start_idx]
+        if updated_start > start_pos or updated_start == empty_field:
             # Pyodide does not support multithreading at the time of writing this. If a a request for signals is received before
             # the raw data has not been loaded we cannot simply wait to finish execution once data is available.
             # This is not ideal and should be improved when(/if) Pyodide implements threading.
             # Multithreading issue: https://github.com/pyodide/pyodide/issues/237.
             print('Pyodide: Requested signals have not been loaded yet (signal start ' + str(updated_start) + ' is out of range).')
-            return signals
-        updated_end = act[_biosignal['data_fields']['updated_end']]
+            break
+        updated_end = act[updated_end_idx]
         if updated_end < act_len and updated_end < end_pos:
             print('Pyodide: Requested signals have not been loaded yet (signal end ' + str(updated_end) + ' is out of range).')
-            return signals
+            break
         # Calculate the channel derivation.
-        sig_act = np.pad(act[start_pos:end_pos], (pad_start, pad_end), 'constant')
-        # Insert possible data gaps.
-        sig_act = _biosignal_insert_gaps(sig_act, chan['data_gaps'])
+        sig_act = _biosignal_pad(act[start_pos:end_pos], pad_start, pad_end)
+        if len(refs) == 1 and not is_common_ref:
+            # Fast path for the most common derivation: subtract the single reference from the active signal data in
+            # place, so no reference signal has to be padded.
+            act_data = sig_act[pad_start:len(sig_act) - pad_end]
+            np.subtract(act_data, input_sigs[refs[0]][start_pos:end_pos], out=act_data)
+            sig_ref = None
         # Use common reference if possible to save computation time.
-        if chan['common_ref'] and chan['type'] in common_ref:
+        elif is_common_ref and chan['type'] in common_ref:
             sig_ref = common_ref[chan['type']]
         else:
-            sig_ref = np.zeros(len(sig_act), dtype='f')
-            ref_chans = list()
-            if len(chan['reference']) == 1:
-                sig_ref = np.pad(
-                    input_sigs[chan['reference'][0]][start_pos:end_pos],
-                    (pad_start, pad_end),
-                    'constant'
-                )
-            elif len(chan['reference']) > 1:
-                for ref_ch in chan['reference']:
-                    ref_chans.append(
-                        np.pad(
-                            input_sigs[ref_ch][start_pos:end_pos],
-                            (pad_start, pad_end),
-                            'constant'
-                        )
-                    )
-                sig_ref = np.mean(ref_chans, axis=0)
-            if len(chan['reference']) > 0:
-                # Insert possible data gaps.
-                sig_ref = _biosignal_insert_gaps(sig_ref, chan['data_gaps'])
+            # No reference channels means no reference to subtract.
+            sig_ref = None
+            if len(refs) == 1:
+                sig_ref = _biosignal_pad(input_sigs[refs[0]][start_pos:end_pos], pad_start, pad_end)
+            elif len(refs) > 1:
+                # Accumulate the average in place, directly between the zero paddings, instead of stacking a padded
+                # copy of every reference channel.
+                sig_ref = np.zeros(pad_start + max(end_pos - start_pos, 0) + pad_end, dtype='f')
+                ref_avg = sig_ref[pad_start:len(sig_ref) - pad_end]
+                for ref_ch in refs:
+                    np.add(ref_avg, input_sigs[ref_ch][start_pos:end_pos], out=ref_avg)
+                ref_avg *= 1.0/len(refs)
             # Save this if montage uses common reference.
-            if chan['common_ref']:
+            if is_common_ref:
                 common_ref[chan['type']] = sig_ref
-        sig = sig_act - sig_ref
+        if sig_ref is not None:
+            # The padded active signal is a fresh copy, so the reference can be subtracted from it in place.
+            np.subtract(sig_act, sig_ref, out=sig_act)
+        # Data gaps are zero in both the active and the reference signal, so they only need to be inserted once, into
+        # the derived signal.
+        signals[idx] = _biosignal_insert_gaps(sig_act, gaps)
         # Check if we should filter this signal.
-        filt_hp = None
-        filt_lp = None
-        filt_notch = None
-        if chan['filters'] is not None:
-            # Use default or individual filters as needed.
-            # None means use default, 0 means do not filter.
-            if chan['filters']['highpass']:
-                filt_key = (sig_fs, chan['filters']['highpass'])
-                if filt_key in hp_coeffs:
-                    filt_hp = hp_coeffs[filt_key]
-                else:
-                    filt_hp = biosignal_get_filter_coefficients(
-                        'highpass', chan['filters']['highpass'], sig_fs
-                    )
-                    hp_coeffs[filt_key] = filt_hp
-            if chan['filters']['lowpass']:
-                filt_key = (sig_fs, chan['filters']['lowpass'])
-                if filt_key in lp_coeffs:
-                    filt_lp = lp_coeffs[filt_key]
-                else:
-                    filt_lp = biosignal_get_filter_coefficients(
-                        'lowpass', chan['filters']['lowpass'], sig_fs
-                    )
-                    lp_coeffs[filt_key] = filt_lp
-            if chan['filters']['notch']:
-                filt_key = (sig_fs, chan['filters']['notch'])
-                if filt_key in notch_coeffs:
-                    filt_notch = notch_coeffs[filt_key]
-                else:
-                    filt_notch = biosignal_get_filter_coefficients(
-                        'notch', chan['filters']['notch'], sig_fs
-                    )
-                    notch_coeffs[filt_key] = filt_notch
-        if filt_hp is not None:
-            sig = signal.sosfiltfilt(filt_hp, sig)
-        if filt_lp is not None:
-            sig = signal.sosfiltfilt(filt_lp, sig)
-        if filt_notch is not None:
-            sig = signal.sosfiltfilt(filt_notch, sig)
-        # Remove the inserted data gaps.
-        sig = _biosignal_remove_gaps(sig, chan['data_gaps'])
-        signals[idx] = sig
+        # Use default or individual filters as needed.
+        # None means use default, 0 means do not filter.
+        filters = chan['filters'] or {}
+        group_key = (
+            sig_fs,
+            filters.get('highpass') or None,
+            filters.get('lowpass') or None,
+            filters.get('notch') or None,
+            len(signals[idx]),
+            chan['filter_len'] > 0,
+        )
+        if group_key in filter_groups:
+            filter_groups[group_key].append(idx)
+        else:
+            filter_groups[group_key] = [idx]
+    for (sig_fs, highpass, lowpass, notch, _, is_padded), group in filter_groups.items():
+        batch = None
+        if highpass or lowpass or notch:
+            # Stack the equal length signals so each filter is applied to the whole group in one call.
+            batch = np.stack([signals[idx] for idx in group])
+            # Signals that already carry filter padding from the actual recording don't need the additional edge
+            # extension, which would only copy the signal once more. Initial conditions still start from steady state.
+            padtype = None if is_padded else 'odd'
+            # Cascade the sections of all the filters, so the group is traversed only once in each direction.
+            sos, zi = _get_filter_cascade(sig_fs, highpass, lowpass, notch)
+            batch = _biosignal_apply_filter(sos, batch, padtype, zi)
+            # Filtering returns float64. Convert the whole group back to float32 in one go, so that each channel row
+            # can be assigned to its output buffer without a conversion of its own.
+            batch = batch.astype('f')
+        for row, idx in enumerate(group):
+            sig = signals[idx] if batch is None else batch[row]
+            # Remove the inserted data gaps.
+            signals[idx] = _biosignal_remove_gaps(sig, channels[idx]['data_gaps'])
     return signals
 
 def biosignal_set_buffers ():
@@ -517,6 +674,9 @@ def biosignal_set_buffers ():
         # Clear montage registry — channel indices are SAB-specific and invalid for the new recording.
         _biosignal['available_montages'].clear()
         _biosignal['montage'] = None
+        # Release the filter designs of the previous recording.
+        _get_sos.cache_clear()
+        _get_filter_cascade.cache_clear()
         _biosignal['buffers'] = buffers
         # Lazy per-channel allocation: each entry materialises on first access via
         # `_ensure_input_array`. Channels never touched by a compute step (e.g. a trend that
@@ -545,6 +705,7 @@ def biosignal_set_default_filters ():
         - `highpass`, `lowpass` and `notch` (dict|None):\\
         -- `Wn` (float): Critical frequency of the filter.\\
         -- `N` (int): Order of the filter (usually between 3-9, optional).
+        - `zero_phase` (bool): Use forward and backward filtering for zero phase distortion (optional).
 
     Returns
     -------
@@ -553,6 +714,8 @@ def biosignal_set_default_filters ():
     try:
         from js import filters
         params = filters.to_py()
+        _get_sos.cache_clear()
+        _get_filter_cascade.cache_clear()
         if 'highpass' in params:
             highpass = params['highpass']
             if highpass is not None:
@@ -583,6 +746,8 @@ def biosignal_set_default_filters ():
                 _biosignal['filters']['notch'] = notch
             else:
                 _biosignal['filters']['notch'] = None
+        if 'zero_phase' in params:
+            _biosignal['filters']['zero_phase'] = bool(params['zero_phase'])
         return { 'success': True }
     except Exception as e:
         return { 'success': False, 'error': str(e) }
@@ -612,6 +777,8 @@ def biosignal_set_filter ():
         from js import Wn, btype, N
         if btype not in _biosignal['filters']:
             return { 'success': False, 'error': "Uknown filter type '" + str(btype) + "'." }
+        _get_sos.cache_clear()
+        _get_filter_cascade.cache_clear()
         _biosignal['filters'][btype] = {
             'Wn': Wn,
             'N': N or None,
@@ -782,8 +949,14 @@ def biosignal_refresh_channels ():
     try:
         from js import specs
         specs_py = specs.to_py()
+        # Copy repeated channel-and-range slices only once, like `biosignal_get_signals` does.
+        refreshed = set()
         for entry in specs_py:
-            _refresh_channel_range(int(entry[0]), int(entry[1]), int(entry[2]))
+            key = (int(entry[0]), int(entry[1]), int(entry[2]))
+            if key in refreshed:
+                continue
+            _refresh_channel_range(*key)
+            refreshed.add(key)
         return { 'success': True }
     except Exception as e:
         return { 'success': False, 'error': str(e) }